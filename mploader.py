@@ -13,27 +13,57 @@ License: MIT
 from __future__ import annotations
 
 import argparse
+import io
+import json
 import logging
+import os
 import re
+import sqlite3
+import subprocess
 import sys
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Set
 
 import requests
 import yt_dlp
-from mutagen.id3 import APIC, COMM, ID3, TALB, TCOM, TCON, TDRC, TIT2, TPE1, TPE2, TPUB
-from mutagen.mp3 import MP3
-from pydub import AudioSegment
+from mutagen.id3 import APIC, COMM, ID3, ID3NoHeaderError, TALB, TCOM, TCON, TDRC, TIT2, TPE1, TPE2, TPUB
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "speedups" extra
+    orjson = None
 
 # Module-level constants
 DEFAULT_OUTPUT_DIR = "downloads"
+CACHE_FILENAME = "responses.sqlite3"
+CACHE_TTL = 24 * 60 * 60  # seconds
 DEFAULT_WORKERS = 3
+METADATA_WORKERS = 16
+PLAYLIST_WORKERS = 8
+ENCODE_WORKERS = os.cpu_count() or 1
 DEFAULT_BITRATE = "320k"
 HIGHEST_QUALITY = "320kbps"
 IMAGE_QUALITY_PREFERENCE = "500x500"
-CHUNK_SIZE = 8192
+CHUNK_SIZE = 1 << 20
+FILENAME_INVALID_CHARS = str.maketrans("", "", '<>:"/\\|?*')
+ARTWORK_TIMEOUT = 30
+ARTWORK_CACHE_SIZE = 64
+ARTWORK_MAX_SIZE = 5 * 1024 * 1024
+ARTWORK_CHUNK_SIZE = 64 * 1024
+REQUEST_TIMEOUT = 30
+ID3_VERSION = 3
+ID3_PADDING = 1024
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
 
 # Configure logging
 logging.basicConfig(
@@ -43,9 +73,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Thread synchronization
-print_lock = threading.Lock()
-
 
 class APIError(Exception):
     """Raised when API requests fail."""
@@ -57,6 +84,164 @@ class DownloadError(Exception):
     pass
 
 
+class ResponseCache:
+    """
+    Persistent key-value cache for JioSaavn API responses.
+
+    Stores JSON-serializable results in a small SQLite database so re-runs
+    of the same playlist can skip metadata requests entirely. Entries older
+    than the TTL are treated as misses, since download URLs can change.
+
+    It also remembers which output file each YouTube video produced. Those
+    entries never expire, so finished tracks are recognised without any
+    API call.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, ttl: float = CACHE_TTL) -> None:
+        """
+        Open (or create) the cache database.
+
+        Args:
+            cache_dir: Directory holding the cache database
+                (defaults to $XDG_CACHE_HOME/mploader or ~/.cache/mploader)
+            ttl: Maximum age of a cached entry in seconds
+        """
+        if cache_dir is None:
+            cache_dir = self.default_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(cache_dir / CACHE_FILENAME),
+            check_same_thread=False
+        )
+        try:
+            with self._lock, self._conn:
+                # WAL with NORMAL sync avoids an fsync on every cached response
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+                )
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS downloads ("
+                    "video_id TEXT PRIMARY KEY, filename TEXT NOT NULL)"
+                )
+                # Expired responses are never served again, so drop them
+                self._conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?",
+                    (time.time() - ttl,)
+                )
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    @staticmethod
+    def default_dir() -> Path:
+        """Return the cache directory, honouring a non-empty XDG_CACHE_HOME."""
+        base = os.environ.get("XDG_CACHE_HOME")
+        return (Path(base) if base else Path.home() / ".cache") / "mploader"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached value for key, or None on a miss or expired entry."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ? AND created_at >= ?",
+                (key, time.time() - self.ttl)
+            ).fetchone()
+        return _parse_json(row[0]) if row else None
+
+    def set(self, key: str, value: Dict) -> None:
+        """Store a value under key, replacing any previous entry."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+                (key, _dump_json(value), time.time())
+            )
+
+    def get_filename(self, video_id: str) -> Optional[str]:
+        """Return the output file name recorded for a YouTube video, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT filename FROM downloads WHERE video_id = ?",
+                (video_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_filename(self, video_id: str, filename: str) -> None:
+        """Record the output file name produced for a YouTube video."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO downloads (video_id, filename) VALUES (?, ?)",
+                (video_id, filename)
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _parse_json(content: bytes | str) -> Dict:
+    """Parse a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _dump_json(value: Dict) -> str:
+    """Serialize a value to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+def _format_duration(seconds: int) -> str:
+    """Format duration in seconds to MM:SS format."""
+    minutes, secs = divmod(seconds, 60)
+    return f"{minutes}:{secs:02d}"
+
+
+def _select_url(links: List[Dict], quality: str) -> Optional[str]:
+    """
+    Pick the URL for the preferred quality from a JioSaavn link list.
+
+    Falls back to the last (highest quality) entry when the preferred
+    quality is not offered.
+    """
+    if not links:
+        return None
+
+    by_quality = {link.get("quality"): link.get("url") for link in links}
+    return by_quality.get(quality) or links[-1].get("url")
+
+
+def _sanitize_filename(name: str) -> str:
+    """Strip characters that are invalid in filenames and cap the length."""
+    return name.translate(FILENAME_INVALID_CHARS)[:200].strip()
+
+
+def _create_filename(song_details: Dict) -> str:
+    """Create sanitized filename from normalized song details."""
+    title = song_details.get("title") or "Unknown"
+    return _sanitize_filename(f"{title} - {song_details['artist']}")
+
+
+@dataclass
+class DownloadStats:
+    """
+    Outcome counters for a single process_url run.
+
+    Worker threads only return results; all updates happen on the main
+    thread while it collects futures, so no locking is required.
+    """
+
+    success: int = 0
+    failed: List[str] = field(default_factory=list)
+    cancelled: List[str] = field(default_factory=list)
+
+
 class JioSaavnClient:
     """
     Client for interacting with JioSaavn API.
@@ -67,13 +252,40 @@ class JioSaavnClient:
     SEARCH_ENDPOINT = "https://saavn.sumit.co/api/search"
     SONG_ENDPOINT = "https://saavn.sumit.co/api/songs"
 
-    def __init__(self) -> None:
-        """Initialize the JioSaavn API client."""
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_WORKERS,
+        cache: Optional[ResponseCache] = None
+    ) -> None:
+        """
+        Initialize the JioSaavn API client.
+
+        The session is shared with audio and artwork downloads, so its
+        connection pool is sized from the number of parallel workers, and
+        never below the metadata resolver's thread count.
+
+        Args:
+            max_workers: Number of parallel workers using this session
+            cache: Optional persistent cache for search and song lookups
+        """
+        self.cache = cache
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         })
 
+        adapter = HTTPAdapter(
+            pool_connections=max_workers * 2,
+            pool_maxsize=max(max_workers * 4, METADATA_WORKERS),
+            max_retries=Retry(
+                total=MAX_RETRIES,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUS_CODES
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def search_song(self, query: str) -> Optional[Dict]:
         """
         Search for a song on JioSaavn.
@@ -84,10 +296,104 @@ class JioSaavnClient:
         Returns:
             Dictionary containing song metadata if found, None otherwise
         """
+        return self._cached(f"search:{query}", lambda: self._search_song(query))
+
+    def get_song_details(self, song_id: str) -> Optional[Dict]:
+        """
+        Retrieve detailed song information including download URLs.
+
+        Args:
+            song_id: JioSaavn song identifier
+
+        Returns:
+            Normalized song metadata (see normalize_song), or None if not found
+        """
+        song_details = self._cached(f"song:{song_id}", lambda: self._get_song_details(song_id))
+        return self.normalize_song(song_details) if song_details else None
+
+    @staticmethod
+    def normalize_song(song_details: Dict) -> Dict:
+        """
+        Flatten a raw song record into the fields used downstream.
+
+        Accepts a song details response, or a search result with the same
+        shape ("name", an "artists" dict and "downloadUrl").
+
+        Runs once per song so the download and tagging code can read plain
+        keys instead of walking the nested API shape.
+        """
+        get = song_details.get
+
+        # Get download and image URLs
+        download_url = _select_url(get("downloadUrl", []), HIGHEST_QUALITY)
+        image_url = _select_url(get("image", []), IMAGE_QUALITY_PREFERENCE)
+
+        # Get artist information
+        artists = get("artists", {})
+        primary_artists = artists.get("primary", [])
+        all_artists = artists.get("all", [])
+
+        artist_names = ", ".join(a.get("name", "") for a in primary_artists) or "Unknown"
+        composers = ", ".join(
+            a.get("name", "") for a in all_artists if a.get("role") == "lyricist"
+        )
+        album_artists = ", ".join(
+            a.get("name", "") for a in all_artists
+            if a.get("role") in ["music", "composer"]
+        )
+
+        # Get album information
+        album = get("album", {})
+        album_name = album.get("name") if isinstance(album, dict) else album
+
+        return {
+            "title": get("name"),
+            "artist": artist_names,
+            "album": album_name,
+            "year": get("year"),
+            "download_url": download_url,
+            "image_url": image_url,
+            "album_artist": album_artists or artist_names,
+            "language": get("language"),
+            "composers": composers or None,
+            "label": get("label"),
+            "copyright": get("copyright"),
+            "url": get("url"),
+            "duration": get("duration")
+        }
+
+    def _cached(self, key: str, fetch: Callable[[], Optional[Dict]]) -> Optional[Dict]:
+        """Return a cached result for key, fetching and storing it on a miss."""
+        if self.cache is None:
+            return fetch()
+
         try:
-            response = self.session.get(self.SEARCH_ENDPOINT, params={"query": query})
+            result = self.cache.get(key)
+        except sqlite3.Error as e:
+            logger.debug(f"Cache read failed for {key}: {e}")
+            result = None
+        if result is not None:
+            logger.debug(f"Cache hit: {key}")
+            return result
+
+        result = fetch()
+        if result is not None:
+            try:
+                self.cache.set(key, result)
+            except sqlite3.Error as e:
+                logger.debug(f"Cache write failed for {key}: {e}")
+        return result
+
+    def _search_song(self, query: str) -> Optional[Dict]:
+        """Search JioSaavn over the network and return the best match."""
+        try:
+            response = self.session.get(
+                self.SEARCH_ENDPOINT,
+                params={"query": query},
+                timeout=REQUEST_TIMEOUT
+            )
             response.raise_for_status()
-            data = response.json()
+            data = _parse_json(response.content)
 
             if not data.get("success"):
                 logger.warning(f"Search failed for query: {query}")
@@ -113,21 +419,13 @@ class JioSaavnClient:
             logger.error(f"Error parsing search results: {e}")
             return None
 
-    def get_song_details(self, song_id: str) -> Optional[Dict]:
-        """
-        Retrieve detailed song information including download URLs.
-
-        Args:
-            song_id: JioSaavn song identifier
-
-        Returns:
-            Dictionary containing detailed song metadata, or None if not found
-        """
+    def _get_song_details(self, song_id: str) -> Optional[Dict]:
+        """Fetch detailed song information from JioSaavn over the network."""
         try:
             url = f"{self.SONG_ENDPOINT}/{song_id}"
-            response = self.session.get(url)
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
+            data = _parse_json(response.content)
 
             if not data.get("success"):
                 logger.error(f"Failed to retrieve song details for ID: {song_id}")
@@ -151,30 +449,64 @@ class YouTubeMetadataExtractor:
     Uses yt-dlp to extract video/playlist information without downloading.
     """
 
-    # Patterns to clean from YouTube titles
+    # Patterns to clean from YouTube titles (negated classes keep matching
+    # inside a single bracket pair; the {0,100} bound, YouTube's title length
+    # limit, keeps unbalanced brackets from backtracking quadratically)
     CLEANUP_PATTERNS = [
-        r"\(Official.*?\)",
-        r"\[Official.*?\]",
+        r"\(Official[^)]{0,100}\)",
+        r"\[Official[^\]]{0,100}\]",
         r"\(Audio\)",
         r"\[Audio\]",
-        r"\(Lyric.*?\)",
-        r"\[Lyric.*?\]",
-        r"\(.*?Video\)",
-        r"\[.*?Video\]",
+        r"\(Lyric[^)]{0,100}\)",
+        r"\[Lyric[^\]]{0,100}\]",
+        r"\([^)]{0,100}Video\)",
+        r"\[[^\]]{0,100}Video\]",
         r"\bHD\b",
         r"\bHQ\b",
-        r"\b4K\b",
-        r"\|.*$"
+        r"\b4K\b"
     ]
 
+    # Compiled once: all cleanup patterns as a single alternation
+    _CLEANUP_RE = re.compile(
+        "|".join(f"(?:{pattern})" for pattern in CLEANUP_PATTERNS),
+        re.IGNORECASE
+    )
+    _WHITESPACE_RE = re.compile(r"\s+")
+
     def __init__(self) -> None:
         """Initialize the YouTube metadata extractor."""
         self.ydl_opts = {
             "quiet": True,
             "no_warnings": True,
-            "extract_flat": True
+            "skip_download": True,
+            # Resolve the URL itself but list playlist entries without
+            # fetching each video; only titles are needed for the search
+            "extract_flat": "in_playlist",
+            "lazy_playlist": True
         }
 
+        # yt-dlp instances are expensive to build and not thread-safe
+        self._ydl = yt_dlp.YoutubeDL(self.ydl_opts)
+        self._ydl_lock = threading.Lock()
+
+        # Per-thread instances for parallel lookups of individual entries
+        self._entry_opts = {**self.ydl_opts, "extract_flat": False}
+        self._local = threading.local()
+        self._entry_ydls: List[yt_dlp.YoutubeDL] = []
+
+    def __enter__(self) -> YouTubeMetadataExtractor:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release resources held by the underlying yt-dlp instances."""
+        self._ydl.close()
+        for ydl in self._entry_ydls:
+            ydl.close()
+        self._entry_ydls.clear()
+
     def extract_metadata(self, url: str) -> List[Dict]:
         """
         Extract metadata from a YouTube URL.
@@ -186,36 +518,75 @@ class YouTubeMetadataExtractor:
             List of dictionaries containing track metadata
         """
         try:
-            with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-
-                if "entries" in info:
-                    # Handle playlist
-                    tracks = [
-                        {
-                            "title": entry.get("title", ""),
-                            "uploader": entry.get("uploader", ""),
-                            "url": entry.get("url", ""),
-                            "id": entry.get("id", "")
-                        }
-                        for entry in info["entries"]
-                        if entry
-                    ]
-                    logger.info(f"Found {len(tracks)} tracks in playlist")
-                    return tracks
-                else:
-                    # Handle single video
-                    return [{
-                        "title": info.get("title", ""),
-                        "uploader": info.get("uploader", ""),
-                        "url": url,
-                        "id": info.get("id", "")
-                    }]
+            with self._ydl_lock:
+                info = self._ydl.extract_info(url, download=False)
+
+            if "entries" in info:
+                # Handle playlist
+                tracks = [
+                    {
+                        "title": entry.get("title", ""),
+                        "uploader": entry.get("uploader", ""),
+                        "id": entry.get("id", "")
+                    }
+                    for entry in info["entries"]
+                    if entry
+                ]
+                logger.info(f"Found {len(tracks)} tracks in playlist")
+                self._fill_missing_titles(tracks)
+                return tracks
+            else:
+                # Handle single video
+                return [{
+                    "title": info.get("title", ""),
+                    "uploader": info.get("uploader", ""),
+                    "id": info.get("id", "")
+                }]
 
         except Exception as e:
             logger.error(f"Error extracting YouTube metadata: {e}")
             return []
 
+    def _fill_missing_titles(self, tracks: List[Dict]) -> None:
+        """
+        Look up titles that the flat playlist listing did not include.
+
+        Flat extraction is a single request but can return bare entries;
+        only those are fetched individually, in parallel.
+        """
+        missing = [track for track in tracks if not track["title"] and track["id"]]
+        if not missing:
+            return
+
+        logger.info(f"Fetching details for {len(missing)} untitled playlist entries")
+        with ThreadPoolExecutor(
+            max_workers=min(PLAYLIST_WORKERS, len(missing)),
+            thread_name_prefix="Playlist"
+        ) as executor:
+            for track, info in zip(missing, executor.map(self._fetch_entry, missing)):
+                if info:
+                    track["title"] = info.get("title") or ""
+                    track["uploader"] = track["uploader"] or info.get("uploader") or ""
+
+    def _fetch_entry(self, track: Dict) -> Optional[Dict]:
+        """Fetch unprocessed video info for one entry using a per-thread yt-dlp."""
+        ydl = getattr(self._local, "ydl", None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(self._entry_opts)
+            self._local.ydl = ydl
+            with self._ydl_lock:
+                self._entry_ydls.append(ydl)
+
+        try:
+            return ydl.extract_info(
+                f"https://www.youtube.com/watch?v={track['id']}",
+                download=False,
+                process=False
+            )
+        except Exception as e:
+            logger.debug(f"Failed to fetch playlist entry {track['id']}: {e}")
+            return None
+
     @classmethod
     def clean_title(cls, title: str) -> str:
         """
@@ -229,13 +600,12 @@ class YouTubeMetadataExtractor:
         Returns:
             Cleaned title string
         """
-        cleaned = title
-        for pattern in cls.CLEANUP_PATTERNS:
-            cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
+        # Drop everything after a pipe (channel names, "| Movie Name", ...)
+        cleaned = title.partition("|")[0]
+        cleaned = cls._CLEANUP_RE.sub("", cleaned)
 
         # Clean up extra whitespace and trailing dashes
-        cleaned = re.sub(r"\s+", " ", cleaned).strip()
-        cleaned = re.sub(r"\s*-\s*$", "", cleaned)
+        cleaned = cls._WHITESPACE_RE.sub(" ", cleaned).rstrip(" -").strip()
 
         return cleaned
 
@@ -247,118 +617,263 @@ class AudioProcessor:
     Downloads audio files, converts to MP3, and embeds comprehensive ID3 tags.
     """
 
-    def __init__(self, session: requests.Session) -> None:
+    # ffmpeg arguments shared by every conversion; only input and output vary
+    FFMPEG_INPUT_ARGS = (
+        "ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error",
+    )
+    FFMPEG_OUTPUT_ARGS = (
+        "-c:a", "libmp3lame",
+        "-b:a", DEFAULT_BITRATE,
+        "-q:a", "0",  # Highest quality VBR
+        "-f", "mp3",  # Output is written to a ".part" name first
+        "-y",
+    )
+
+    def __init__(
+        self,
+        session: requests.Session,
+        max_workers: int = DEFAULT_WORKERS
+    ) -> None:
         """
         Initialize the audio processor.
 
         Args:
             session: Requests session for downloads
+            max_workers: Number of threads used to prefetch album artwork
         """
         self.session = session
+        self._artwork_executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="Artwork"
+        )
+
+        # Album tracks share cover art; keep recent downloads keyed by URL
+        self._artwork_cache: OrderedDict[str, Future] = OrderedDict()
+        self._artwork_lock = threading.Lock()
 
-    def download_audio(self, url: str, output_path: Path) -> bool:
+    def download_audio(self, url: str) -> Optional[bytes]:
         """
-        Download audio file from URL.
+        Download audio file from URL into memory.
 
         Args:
             url: Download URL
-            output_path: Path where file should be saved
 
         Returns:
-            True if successful, False otherwise
+            Raw audio bytes if successful, None otherwise
         """
         try:
-            response = self.session.get(url, stream=True)
-            response.raise_for_status()
+            # Closing the response returns its connection to the shared pool
+            with self.session.get(url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+                response.raise_for_status()
+
+                # Read the raw stream directly; CDN audio is normally sent
+                # without Content-Encoding, so decoding can usually be skipped
+                decode = "Content-Encoding" in response.headers
+                chunks = []
+                while True:
+                    chunk = response.raw.read(CHUNK_SIZE, decode_content=decode)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                data = b"".join(chunks)
+
+            return data
+
+        except (requests.RequestException, Urllib3HTTPError) as e:
+            # Reading response.raw directly surfaces urllib3's own errors
+            # (truncated body, read timeout, decode error) unwrapped
+            logger.error(f"Download failed: {e}")
+            return None
+
+    @staticmethod
+    def save_audio(data: bytes, output_path: Path) -> None:
+        """
+        Write audio bytes to disk with as few syscalls as possible.
+
+        The data is written to a ".part" file, preallocated to its final
+        size where the platform supports it, and then atomically renamed
+        into place so an interrupted run never leaves a truncated output.
+
+        Args:
+            data: Audio bytes to write
+            output_path: Destination file path
+        """
+        part_path = output_path.with_name(f"{output_path.name}.part")
+        # O_BINARY keeps Windows from translating newline bytes
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(str(part_path), flags, 0o644)
+        try:
+            try:
+                if data and hasattr(os, "posix_fallocate"):
+                    try:
+                        os.posix_fallocate(fd, 0, len(data))
+                    except OSError:
+                        pass  # Filesystem does not support preallocation
+
+                view = memoryview(data)
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+            finally:
+                os.close(fd)
+
+            os.replace(part_path, output_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def is_mp3(data: bytes) -> bool:
+        """
+        Check whether audio data is already MP3 by sniffing its header.
 
-            with open(output_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
-                    if chunk:
-                        f.write(chunk)
+        Accepts an ID3v2 tag or a bare MPEG audio frame sync. ADTS (AAC)
+        shares the frame sync, so the layer bits are checked as well.
 
-            logger.info(f"Downloaded: {output_path.name}")
+        Args:
+            data: Raw audio bytes
+
+        Returns:
+            True if the data looks like MP3, False otherwise
+        """
+        if data.startswith(b"ID3"):
             return True
+        return (
+            len(data) >= 2
+            and data[0] == 0xFF
+            and (data[1] & 0xE0) == 0xE0
+            and (data[1] & 0x06) != 0
+        )
 
-        except requests.RequestException as e:
-            logger.error(f"Download failed: {e}")
-            return False
-        except IOError as e:
-            logger.error(f"File write error: {e}")
-            return False
+    @staticmethod
+    def is_pipeable(data: bytes) -> bool:
+        """
+        Check whether ffmpeg can read audio data from a non-seekable pipe.
+
+        MP4/M4A files can only be demuxed from a pipe when the "moov" index
+        comes before the "mdat" payload (faststart); other containers are
+        read sequentially anyway.
 
-    def convert_to_mp3(self, input_path: Path, output_path: Path) -> bool:
+        Args:
+            data: Raw audio bytes
+
+        Returns:
+            True if the data can be piped to ffmpeg, False otherwise
         """
-        Convert audio file to MP3 format.
+        if data[4:8] != b"ftyp":
+            return True
+
+        offset = 0
+        while offset + 8 <= len(data):
+            size = int.from_bytes(data[offset:offset + 4], "big")
+            box_type = data[offset + 4:offset + 8]
+            if box_type == b"moov":
+                return True
+            if box_type == b"mdat":
+                return False
+            if size == 1:  # 64-bit box size follows the type
+                size = int.from_bytes(data[offset + 8:offset + 16], "big")
+            if size < 8:
+                return False
+            offset += size
+        return False
+
+    def convert_to_mp3(self, source: Path | bytes, output_path: Path) -> bool:
+        """
+        Convert audio to MP3 format.
+
+        Runs ffmpeg directly so the audio is streamed through the encoder
+        instead of being decoded into memory first. In-memory audio is fed
+        through ffmpeg's stdin, so it never has to be written to disk.
 
         Args:
-            input_path: Path to input audio file
+            source: Path to input audio file, or raw audio bytes
+                (see is_pipeable)
             output_path: Path for output MP3 file
 
         Returns:
             True if successful, False otherwise
         """
+        piped = isinstance(source, bytes)
+        command = [
+            *self.FFMPEG_INPUT_ARGS,
+            "-i", "pipe:0" if piped else str(source),
+            *self.FFMPEG_OUTPUT_ARGS,
+            str(output_path)
+        ]
+
         try:
-            audio = AudioSegment.from_file(str(input_path))
-            audio.export(
-                str(output_path),
-                format="mp3",
-                bitrate=DEFAULT_BITRATE,
-                parameters=["-q:a", "0"]  # Highest quality VBR
+            subprocess.run(
+                command,
+                input=source if piped else None,
+                check=True,
+                capture_output=True
             )
-
             logger.info(f"Converted to MP3: {output_path.name}")
             return True
 
-        except Exception as e:
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Conversion failed: {e.stderr.decode(errors='replace').strip()}")
+            return False
+        except OSError as e:
             logger.error(f"Conversion failed: {e}")
             return False
 
-    def embed_metadata(self, file_path: Path, metadata: Dict) -> bool:
+    def close(self) -> None:
+        """Stop the artwork prefetch threads."""
+        self._artwork_executor.shutdown(wait=False, cancel_futures=True)
+
+    def prefetch_artwork(self, image_url: str) -> Future:
+        """
+        Start downloading album artwork in the background.
+
+        Artwork is cached per URL, so tracks from the same album share a
+        single download. Failed downloads are retried on the next request.
+
+        Args:
+            image_url: Artwork URL
+
+        Returns:
+            Future resolving to the image bytes, or None on failure
+        """
+        with self._artwork_lock:
+            future = self._artwork_cache.get(image_url)
+            if future is not None and not self._artwork_failed(future):
+                self._artwork_cache.move_to_end(image_url)
+                return future
+
+            future = self._artwork_executor.submit(self._fetch_artwork, image_url)
+            self._artwork_cache[image_url] = future
+            if len(self._artwork_cache) > ARTWORK_CACHE_SIZE:
+                self._artwork_cache.popitem(last=False)
+            return future
+
+    @staticmethod
+    def _artwork_failed(future: Future) -> bool:
+        """Check whether a finished artwork download produced no image."""
+        return future.done() and (future.cancelled() or future.result() is None)
+
+    def embed_metadata(
+        self,
+        file_path: Path,
+        metadata: Dict,
+        artwork: Optional[Future] = None
+    ) -> bool:
         """
         Embed comprehensive ID3 metadata into MP3 file.
 
         Args:
             file_path: Path to MP3 file
             metadata: Dictionary containing metadata fields
+            artwork: Optional prefetched artwork from prefetch_artwork()
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            audio = MP3(str(file_path), ID3=ID3)
-
-            # Initialize ID3 tags if needed
-            try:
-                audio.add_tags()
-            except Exception:
-                pass  # Tags already exist
-
-            # Basic metadata
-            self._add_text_frame(audio, TIT2, metadata.get("title"))
-            self._add_text_frame(audio, TPE1, metadata.get("artist"))
-            self._add_text_frame(audio, TALB, metadata.get("album"))
-            self._add_text_frame(audio, TDRC, metadata.get("year"))
-
-            # Extended metadata
-            self._add_text_frame(audio, TPE2, metadata.get("album_artist"))
-            self._add_text_frame(audio, TCON, metadata.get("language", "").title())
-            self._add_text_frame(audio, TCOM, metadata.get("composers"))
-            self._add_text_frame(audio, TPUB, metadata.get("label"))
-
-            # Comments
-            self._add_comment(audio, "Copyright", metadata.get("copyright"))
-            self._add_comment(audio, "URL", metadata.get("url"))
-
-            # Duration
-            if metadata.get("duration"):
-                duration_str = self._format_duration(metadata["duration"])
-                self._add_comment(audio, "Duration", duration_str)
-
-            # Album artwork
-            if metadata.get("image_url"):
-                self._embed_artwork(audio, metadata["image_url"])
-
-            audio.save()
+            tags = self._load_tags(str(file_path))
+            self._apply_tags(tags, metadata, artwork)
+            tags.save(str(file_path), v2_version=ID3_VERSION, padding=self._tag_padding)
             logger.info(f"Embedded metadata: {file_path.name}")
             return True
 
@@ -366,33 +881,139 @@ class AudioProcessor:
             logger.error(f"Metadata embedding failed: {e}")
             return False
 
-    def _add_text_frame(self, audio: MP3, frame_class, text: Optional[str]) -> None:
+    def embed_metadata_bytes(
+        self,
+        data: bytes,
+        metadata: Dict,
+        artwork: Optional[Future] = None
+    ) -> Optional[bytes]:
+        """
+        Embed comprehensive ID3 metadata into in-memory MP3 data.
+
+        Args:
+            data: Raw MP3 bytes
+            metadata: Dictionary containing metadata fields
+            artwork: Optional prefetched artwork from prefetch_artwork()
+
+        Returns:
+            Tagged MP3 bytes if successful, None otherwise
+        """
+        try:
+            buffer = io.BytesIO(data)
+            tags = self._load_tags(buffer)
+            self._apply_tags(tags, metadata, artwork)
+            buffer.seek(0)
+            tags.save(buffer, v2_version=ID3_VERSION, padding=self._tag_padding)
+            return buffer.getvalue()
+
+        except Exception as e:
+            logger.error(f"Metadata embedding failed: {e}")
+            return None
+
+    @staticmethod
+    def _load_tags(source) -> ID3:
+        """Load the existing ID3 tag, or start an empty one if there is none."""
+        try:
+            return ID3(source)
+        except ID3NoHeaderError:
+            if isinstance(source, io.IOBase):
+                source.seek(0)
+            return ID3()
+
+    def _apply_tags(
+        self,
+        tags: ID3,
+        metadata: Dict,
+        artwork: Optional[Future] = None
+    ) -> None:
+        """Add all ID3 frames for the given metadata to a loaded tag."""
+        # Basic metadata
+        self._add_text_frame(tags, TIT2, metadata.get("title"))
+        self._add_text_frame(tags, TPE1, metadata.get("artist"))
+        self._add_text_frame(tags, TALB, metadata.get("album"))
+        self._add_text_frame(tags, TDRC, metadata.get("year"))
+
+        # Extended metadata
+        self._add_text_frame(tags, TPE2, metadata.get("album_artist"))
+        self._add_text_frame(tags, TCON, metadata.get("language", "").title())
+        self._add_text_frame(tags, TCOM, metadata.get("composers"))
+        self._add_text_frame(tags, TPUB, metadata.get("label"))
+
+        # Comments
+        self._add_comment(tags, "Copyright", metadata.get("copyright"))
+        self._add_comment(tags, "URL", metadata.get("url"))
+
+        # Duration
+        if metadata.get("duration"):
+            duration_str = _format_duration(metadata["duration"])
+            self._add_comment(tags, "Duration", duration_str)
+
+        # Album artwork, unless the source already carried a cover over
+        if metadata.get("image_url") and not tags.getall("APIC"):
+            self._embed_artwork(tags, metadata["image_url"], artwork)
+
+    @staticmethod
+    def _tag_padding(info) -> int:
+        """
+        Keep the existing padding when the new tag fits in place.
+
+        Only when the tag has to grow (and the audio data moves anyway) is
+        a fixed ID3_PADDING reserved for later edits.
+        """
+        return info.padding if info.padding >= 0 else ID3_PADDING
+
+    def _add_text_frame(self, tags: ID3, frame_class, text: Optional[str]) -> None:
         """Add text frame to ID3 tags if text is provided."""
         if text:
-            audio.tags.add(frame_class(encoding=3, text=str(text)))
+            tags.add(frame_class(encoding=3, text=str(text)))
 
-    def _add_comment(self, audio: MP3, description: str, text: Optional[str]) -> None:
+    def _add_comment(self, tags: ID3, description: str, text: Optional[str]) -> None:
         """Add comment frame to ID3 tags if text is provided."""
         if text:
-            audio.tags.add(COMM(encoding=3, lang="eng", desc=description, text=text))
+            tags.add(COMM(encoding=3, lang="eng", desc=description, text=text))
 
-    def _format_duration(self, seconds: int) -> str:
-        """Format duration in seconds to MM:SS format."""
-        minutes = seconds // 60
-        secs = seconds % 60
-        return f"{minutes}:{secs:02d}"
+    def _fetch_artwork(self, image_url: str) -> Optional[bytes]:
+        """Download album artwork, returning None on failure or if oversized."""
+        try:
+            with self.session.get(image_url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+                if response.status_code != 200:
+                    return None
+
+                if int(response.headers.get("Content-Length") or 0) > ARTWORK_MAX_SIZE:
+                    logger.debug(f"Artwork too large, skipping: {image_url}")
+                    return None
+
+                # Content-Length may be missing, so enforce the cap while reading
+                data = bytearray()
+                for chunk in response.iter_content(ARTWORK_CHUNK_SIZE):
+                    data.extend(chunk)
+                    if len(data) > ARTWORK_MAX_SIZE:
+                        logger.debug(f"Artwork too large, skipping: {image_url}")
+                        return None
+                return bytes(data)
+        except Exception as e:
+            logger.debug(f"Failed to download artwork: {e}")
+        return None
 
-    def _embed_artwork(self, audio: MP3, image_url: str) -> None:
-        """Download and embed album artwork."""
+    def _embed_artwork(
+        self,
+        tags: ID3,
+        image_url: str,
+        artwork: Optional[Future] = None
+    ) -> None:
+        """Embed album artwork, using the prefetched download if available."""
         try:
-            response = self.session.get(image_url)
-            if response.status_code == 200:
-                audio.tags.add(APIC(
+            if artwork is None:
+                artwork = self.prefetch_artwork(image_url)
+            data = artwork.result(timeout=ARTWORK_TIMEOUT)
+
+            if data:
+                tags.add(APIC(
                     encoding=3,
                     mime="image/jpeg",
                     type=3,
                     desc="Cover",
-                    data=response.content
+                    data=data
                 ))
         except Exception as e:
             logger.debug(f"Failed to embed artwork: {e}")
@@ -406,28 +1027,61 @@ class MusicDownloader:
     and audio processing with multi-threaded execution.
     """
 
-    def __init__(self, output_dir: str = DEFAULT_OUTPUT_DIR) -> None:
+    def __init__(
+        self,
+        output_dir: str = DEFAULT_OUTPUT_DIR,
+        max_workers: int = DEFAULT_WORKERS,
+        use_cache: bool = True
+    ) -> None:
         """
         Initialize the music downloader.
 
         Args:
             output_dir: Directory where downloaded files will be saved
+            max_workers: Maximum number of parallel download workers
+            use_cache: Whether to cache JioSaavn API responses on disk
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.max_workers = max_workers
 
-        self.jiosaavn_client = JioSaavnClient()
+        self.cache = None
+        if use_cache:
+            try:
+                self.cache = ResponseCache()
+            except (OSError, RuntimeError, sqlite3.Error) as e:
+                # RuntimeError: Path.home() could not find a home directory
+                logger.warning(f"Response cache unavailable, continuing without it: {e}")
+        self.jiosaavn_client = JioSaavnClient(max_workers=max_workers, cache=self.cache)
         self.youtube_extractor = YouTubeMetadataExtractor()
-        self.audio_processor = AudioProcessor(self.jiosaavn_client.session)
+        self.audio_processor = AudioProcessor(
+            self.jiosaavn_client.session,
+            max_workers=max_workers
+        )
 
-    def process_url(self, url: str, max_workers: int = DEFAULT_WORKERS) -> None:
+    def __enter__(self) -> MusicDownloader:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the YouTube extractor, cache, and background download threads."""
+        self.youtube_extractor.close()
+        self.audio_processor.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    def process_url(self, url: str, max_workers: Optional[int] = None) -> None:
         """
         Process YouTube URL and download matching tracks.
 
         Args:
             url: YouTube video or playlist URL
             max_workers: Maximum number of parallel download workers
+                (defaults to the value given at construction)
         """
+        max_workers = max_workers or self.max_workers
         logger.info(f"Extracting metadata from: {url}")
 
         tracks = self.youtube_extractor.extract_metadata(url)
@@ -439,244 +1093,411 @@ class MusicDownloader:
         logger.info(f"Processing {total_tracks} track(s) with {max_workers} parallel workers")
 
         # Statistics tracking
-        stats = {
-            "success": 0,
-            "failed": [],
-            "cancelled": []
-        }
+        stats = DownloadStats()
 
-        # Execute downloads in parallel
-        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Worker") as executor:
-            future_to_track = {
-                executor.submit(self._process_single_track, track): (i, track)
-                for i, track in enumerate(tracks, 1)
-            }
+        # Phase 1: resolve JioSaavn metadata for all tracks up front
+        resolved = self._resolve_tracks(tracks, stats)
+        logger.info(
+            f"Resolved {len(resolved)}/{total_tracks} track(s) on JioSaavn "
+            f"({stats.success} already downloaded)"
+        )
+
+        # Phase 2: download in parallel, handing finished downloads to encoders
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="Worker"
+        ) as executor, ThreadPoolExecutor(
+            max_workers=ENCODE_WORKERS,
+            thread_name_prefix="Encoder"
+        ) as encode_executor:
+            self._process_futures(
+                resolved, total_tracks, stats, executor, encode_executor,
+                max_in_flight=max_workers + ENCODE_WORKERS
+            )
+
+        # Display summary
+        self._display_summary(total_tracks, stats)
+
+    def _resolve_tracks(self, tracks: List[Dict], stats: DownloadStats) -> List[tuple]:
+        """
+        Look up all tracks on JioSaavn using a dedicated metadata pool.
+
+        Searches are small JSON requests, so they run with more workers than
+        downloads and finish before any audio transfer starts. Tracks whose
+        recorded output file (see _is_downloaded) is already in the output
+        directory are counted as successful without any API call; tracks
+        that cannot be resolved are recorded as failed.
+
+        Args:
+            tracks: Track metadata from YouTube
+            stats: Statistics to update
+
+        Returns:
+            List of (track_number, track, song_details) tuples in playlist order
+        """
+        resolved = []
+        existing_files = {path.name for path in self.output_dir.glob("*.mp3")}
+
+        with ThreadPoolExecutor(
+            max_workers=min(METADATA_WORKERS, len(tracks)),
+            thread_name_prefix="Resolver"
+        ) as executor:
+            future_to_track = {}
+            for i, track in enumerate(tracks, 1):
+                if self._is_downloaded(track, existing_files):
+                    logger.info(f"Already exists: {track.get('title', 'Unknown')}")
+                    stats.success += 1
+                    continue
+                future_to_track[executor.submit(self._resolve_track, track)] = (i, track)
 
             try:
-                self._process_futures(future_to_track, total_tracks, stats)
+                for future in as_completed(future_to_track):
+                    track_num, track = future_to_track[future]
+                    song_details = future.result()
+                    if song_details:
+                        resolved.append((track_num, track, song_details))
+                    else:
+                        stats.failed.append(track.get("title", "Unknown"))
             except KeyboardInterrupt:
-                self._handle_interrupt(future_to_track, stats)
+                self._handle_interrupt(executor, future_to_track, stats)
                 raise
 
-        # Display summary
-        self._display_summary(total_tracks, stats)
+        resolved.sort(key=lambda item: item[0])
+        return resolved
+
+    def _is_downloaded(self, track: Dict, existing_files: Set[str]) -> bool:
+        """
+        Check whether a YouTube track already has its output file.
+
+        Uses the video -> file name mapping recorded by earlier runs, so
+        only files this track actually produced count as a match.
+        """
+        video_id = track.get("id")
+        if self.cache is None or not video_id:
+            return False
+
+        try:
+            return self.cache.get_filename(video_id) in existing_files
+        except sqlite3.Error as e:
+            logger.debug(f"Cache read failed for video {video_id}: {e}")
+            return False
+
+    def _remember_download(self, track: Dict, output_file: Path) -> None:
+        """Record which output file a YouTube track produced."""
+        video_id = track.get("id")
+        if self.cache is None or not video_id:
+            return
+
+        try:
+            self.cache.set_filename(video_id, output_file.name)
+        except sqlite3.Error as e:
+            logger.debug(f"Cache write failed for video {video_id}: {e}")
 
     def _process_futures(
         self,
-        future_to_track: Dict,
+        resolved: List[tuple],
         total_tracks: int,
-        stats: Dict
+        stats: DownloadStats,
+        executor: ThreadPoolExecutor,
+        encode_executor: ThreadPoolExecutor,
+        max_in_flight: int
     ) -> None:
-        """Process completed futures and update statistics."""
-        for future in as_completed(future_to_track):
-            track_num, track = future_to_track[future]
+        """
+        Run downloads and encodes for resolved tracks and update statistics.
+
+        Completed downloads are submitted to the encode executor so that
+        conversion and tagging never hold a download slot. Downloads are
+        only submitted while fewer than max_in_flight tracks are downloading
+        or waiting to be encoded, so downloaded audio cannot pile up in
+        memory when encoding is the bottleneck.
+
+        On the first Ctrl+C pending downloads are cancelled, but downloads
+        already in flight are still encoded before KeyboardInterrupt is
+        re-raised. A second Ctrl+C also drops encodes that have not started
+        and re-raises at once; leaving the executors in process_url still
+        waits for the downloads and ffmpeg runs that are already underway.
+        """
+        backlog = iter(resolved)
+        future_to_track = {}
+        pending = set()
+        encode_futures = {}
+        interrupted = False
+
+        def submit_downloads() -> None:
+            while not interrupted and len(pending) < max_in_flight:
+                item = next(backlog, None)
+                if item is None:
+                    return
+                track_num, track, song_details = item
+                future = executor.submit(self._download_track, song_details)
+                future_to_track[future] = (track_num, track)
+                pending.add(future)
+
+        submit_downloads()
+        while pending:
             try:
-                if future.result():
-                    stats["success"] += 1
-                    logger.info(f"[{stats['success']}/{total_tracks}] Completed successfully")
-                else:
-                    stats["failed"].append(track.get("title", "Unknown"))
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            except KeyboardInterrupt:
+                if interrupted:
+                    encode_executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+                interrupted = True
+                self._handle_interrupt(executor, future_to_track, stats, backlog)
+                pending = {future for future in pending if not future.cancelled()}
+                continue
+
+            for future in done:
+                track_num, track = future_to_track[future]
+                if future in encode_futures:
+                    self._record_result(
+                        future, track_num, track, total_tracks, stats, encode_futures[future]
+                    )
+                    continue
+
+                try:
+                    job = future.result()
+                except Exception as e:
+                    job = None
+                    logger.error(f"[{track_num}/{total_tracks}] Exception: {e}")
+
+                if job is None:
+                    stats.failed.append(track.get("title", "Unknown"))
                     logger.warning(f"[{track_num}/{total_tracks}] Failed to process")
-            except Exception as e:
-                stats["failed"].append(track.get("title", "Unknown"))
-                logger.error(f"[{track_num}/{total_tracks}] Exception: {e}")
+                    continue
+
+                encode_future = encode_executor.submit(self._encode_track, job)
+                future_to_track[encode_future] = (track_num, track)
+                encode_futures[encode_future] = job["output_file"]
+                pending.add(encode_future)
+
+            submit_downloads()
+
+        if interrupted:
+            raise KeyboardInterrupt
+
+    def _record_result(
+        self,
+        future: Future,
+        track_num: int,
+        track: Dict,
+        total_tracks: int,
+        stats: DownloadStats,
+        output_file: Path
+    ) -> None:
+        """Update statistics from a finished encode future."""
+        try:
+            if future.result():
+                stats.success += 1
+                self._remember_download(track, output_file)
+                logger.info(f"[{stats.success}/{total_tracks}] Completed successfully")
+            else:
+                stats.failed.append(track.get("title", "Unknown"))
+                logger.warning(f"[{track_num}/{total_tracks}] Failed to process")
+        except Exception as e:
+            stats.failed.append(track.get("title", "Unknown"))
+            logger.error(f"[{track_num}/{total_tracks}] Exception: {e}")
 
-    def _handle_interrupt(self, future_to_track: Dict, stats: Dict) -> None:
+    def _handle_interrupt(
+        self,
+        executor: ThreadPoolExecutor,
+        future_to_track: Dict,
+        stats: DownloadStats,
+        backlog: Iterable[tuple] = ()
+    ) -> None:
         """Handle keyboard interrupt gracefully."""
         logger.info("\n\nReceived Ctrl+C! Gracefully shutting down...")
         logger.info("Finishing current downloads, cancelling pending tasks...")
 
-        # Cancel pending futures
-        for future in future_to_track:
-            if not future.running() and not future.done():
-                if future.cancel():
-                    _, track = future_to_track[future]
-                    stats["cancelled"].append(track.get("title", "Unknown"))
+        # Cancel everything still queued on the executor in one step;
+        # running tasks are left to finish
+        executor.shutdown(wait=False, cancel_futures=True)
+        for future, (_, track) in future_to_track.items():
+            if future.cancelled():
+                stats.cancelled.append(track.get("title", "Unknown"))
 
-        logger.info(f"Cancelled {len(stats['cancelled'])} pending tasks")
+        # Tracks that were never submitted
+        for _, track, _ in backlog:
+            stats.cancelled.append(track.get("title", "Unknown"))
+
+        logger.info(f"Cancelled {len(stats.cancelled)} pending tasks")
         logger.info("Waiting for running tasks to complete...")
 
-    def _display_summary(self, total: int, stats: Dict) -> None:
+    def _display_summary(self, total: int, stats: DownloadStats) -> None:
         """Display download summary."""
         logger.info(f"\n{'='*60}")
         logger.info("Download Summary:")
         logger.info(
             f"Total: {total} | "
-            f"Success: {stats['success']} | "
-            f"Failed: {len(stats['failed'])} | "
-            f"Cancelled: {len(stats['cancelled'])}"
+            f"Success: {stats.success} | "
+            f"Failed: {len(stats.failed)} | "
+            f"Cancelled: {len(stats.cancelled)}"
         )
 
-        if stats["failed"]:
+        if stats.failed:
             logger.info("\nFailed tracks:")
-            for track in stats["failed"]:
+            for track in stats.failed:
                 logger.info(f"  - {track}")
 
-        if stats["cancelled"]:
+        if stats.cancelled:
             logger.info("\nCancelled tracks:")
-            for track in stats["cancelled"]:
+            for track in stats.cancelled:
                 logger.info(f"  - {track}")
 
         logger.info(f"{'='*60}")
 
-    def _process_single_track(self, track_info: Dict) -> bool:
+    def _resolve_track(self, track_info: Dict) -> Optional[Dict]:
         """
-        Process a single track: search, download, convert, tag.
+        Find the JioSaavn song matching a YouTube track.
 
         Args:
             track_info: Dictionary containing track metadata from YouTube
 
         Returns:
-            True if processing succeeded, False otherwise
+            Detailed song metadata if found, None otherwise
         """
         try:
             # Clean title and search
             cleaned_title = self.youtube_extractor.clean_title(track_info["title"])
-            logger.info(f"Processing: {cleaned_title}")
+            logger.info(f"Resolving: {cleaned_title}")
 
             # Search on JioSaavn
             search_result = self.jiosaavn_client.search_song(cleaned_title)
             if not search_result or not search_result.get("id"):
                 logger.warning(f"Not found on JioSaavn: {cleaned_title}")
-                return False
+                return None
 
-            # Get detailed song information
-            song_details = self.jiosaavn_client.get_song_details(search_result["id"])
+            # Search results that are full song records (details-shaped,
+            # with download URLs) need no separate details request; plain
+            # search hits use "title"/"primaryArtists" and must be looked up
+            if (
+                search_result.get("downloadUrl")
+                and search_result.get("name")
+                and isinstance(search_result.get("artists"), dict)
+            ):
+                song_details = self.jiosaavn_client.normalize_song(search_result)
+            else:
+                song_details = self.jiosaavn_client.get_song_details(search_result["id"])
             if not song_details:
                 logger.warning(f"Could not retrieve song details: {cleaned_title}")
-                return False
+                return None
+
+            return song_details
 
-            # Extract download URL
-            download_url = self._get_download_url(song_details)
+        except Exception as e:
+            logger.error(f"Error resolving track: {e}")
+            return None
+
+    def _download_track(self, song_details: Dict) -> Optional[Dict]:
+        """
+        Download audio for a resolved JioSaavn song.
+
+        Args:
+            song_details: Normalized song metadata from JioSaavnClient
+
+        Returns:
+            Encode job for _encode_track, or None if the download failed
+        """
+        try:
+            song_name = song_details.get("title") or "Unknown"
+
+            download_url = song_details["download_url"]
             if not download_url:
-                logger.warning(f"No download URL available: {cleaned_title}")
-                return False
+                logger.warning(f"No download URL available: {song_name}")
+                return None
 
             # Prepare file paths
-            filename = self._create_filename(song_details)
+            filename = _create_filename(song_details)
             temp_file = self.output_dir / f"{filename}.temp"
             output_file = self.output_dir / f"{filename}.mp3"
 
+            job = {
+                "output_file": output_file,
+                "temp_file": temp_file,
+                "audio_data": None,
+                "metadata": None,
+                "artwork": None
+            }
+
             # Skip if already exists
             if output_file.exists():
                 logger.info(f"Already exists: {output_file.name}")
-                return True
+                return job
 
-            # Download and process
-            if not self._download_and_convert(download_url, temp_file, output_file):
-                return False
+            job["metadata"] = song_details
 
-            # Embed metadata
-            metadata = self._extract_metadata(song_details)
-            self.audio_processor.embed_metadata(output_file, metadata)
+            # Fetch artwork alongside the audio download
+            if song_details["image_url"]:
+                job["artwork"] = self.audio_processor.prefetch_artwork(song_details["image_url"])
 
-            logger.info(f"Successfully processed: {output_file.name}")
-            return True
-
-        except Exception as e:
-            logger.error(f"Error processing track: {e}")
-            return False
+            job["audio_data"] = self.audio_processor.download_audio(download_url)
+            if job["audio_data"] is None:
+                return None
 
-    def _get_download_url(self, song_details: Dict) -> Optional[str]:
-        """Extract highest quality download URL from song details."""
-        download_links = song_details.get("downloadUrl", [])
-        if not download_links:
-            return None
+            logger.info(f"Downloaded: {output_file.name} ({len(job['audio_data'])} bytes)")
 
-        # Prefer 320kbps quality
-        for link in download_links:
-            if link.get("quality") == HIGHEST_QUALITY:
-                return link.get("url")
+            return job
 
-        # Fallback to highest available
-        return download_links[-1].get("url")
+        except Exception as e:
+            logger.error(f"Error downloading track: {e}")
+            return None
 
-    def _create_filename(self, song_details: Dict) -> str:
-        """Create sanitized filename from song details."""
-        artists = song_details.get("artists", {}).get("primary", [])
-        artist_names = ", ".join(a.get("name", "") for a in artists) or "Unknown"
+    def _encode_track(self, job: Dict) -> bool:
+        """
+        Convert downloaded audio to MP3 if needed and embed metadata.
 
-        title = song_details.get("name", "Unknown")
-        filename = f"{title} - {artist_names}"
+        Args:
+            job: Encode job produced by _download_track
 
-        # Sanitize filename
-        filename = re.sub(r'[<>:"/\\|?*]', "", filename)
-        filename = filename[:200].strip()
+        Returns:
+            True if processing succeeded, False otherwise
+        """
+        audio_data = job["audio_data"]
+        output_file = job["output_file"]
+        temp_file = job["temp_file"]
+        part_file = output_file.with_name(f"{output_file.name}.part")
 
-        return filename
+        # Nothing downloaded: file was already on disk
+        if audio_data is None:
+            return True
 
-    def _download_and_convert(
-        self,
-        download_url: str,
-        temp_file: Path,
-        output_file: Path
-    ) -> bool:
-        """Download audio and convert to MP3."""
         try:
-            # Download
-            if not self.audio_processor.download_audio(download_url, temp_file):
-                return False
+            # Already MP3: tag in memory and write the file once
+            if self.audio_processor.is_mp3(audio_data):
+                tagged = self.audio_processor.embed_metadata_bytes(
+                    audio_data, job["metadata"], job["artwork"]
+                )
+                self.audio_processor.save_audio(
+                    tagged if tagged is not None else audio_data,
+                    output_file
+                )
+            else:
+                # Convert, piping the audio to ffmpeg unless it needs to seek
+                if self.audio_processor.is_pipeable(audio_data):
+                    converted = self.audio_processor.convert_to_mp3(audio_data, part_file)
+                else:
+                    self.audio_processor.save_audio(audio_data, temp_file)
+                    converted = self.audio_processor.convert_to_mp3(temp_file, part_file)
+                    temp_file.unlink(missing_ok=True)
 
-            # Convert
-            if not self.audio_processor.convert_to_mp3(temp_file, output_file):
-                temp_file.unlink(missing_ok=True)
-                return False
+                if not converted:
+                    part_file.unlink(missing_ok=True)
+                    return False
 
-            # Cleanup
-            temp_file.unlink(missing_ok=True)
+                # Embed metadata, then move the finished file into place
+                self.audio_processor.embed_metadata(
+                    part_file, job["metadata"], job["artwork"]
+                )
+                os.replace(part_file, output_file)
+
+            logger.info(f"Successfully processed: {output_file.name}")
             return True
 
         except Exception as e:
-            logger.error(f"Download/conversion error: {e}")
+            logger.error(f"Conversion/tagging error: {e}")
             temp_file.unlink(missing_ok=True)
+            part_file.unlink(missing_ok=True)
             return False
 
-    def _extract_metadata(self, song_details: Dict) -> Dict:
-        """Extract metadata dictionary from song details."""
-        # Get image URL
-        images = song_details.get("image", [])
-        image_url = None
-        if images:
-            for img in images:
-                if img.get("quality") == IMAGE_QUALITY_PREFERENCE:
-                    image_url = img.get("url")
-                    break
-            if not image_url:
-                image_url = images[-1].get("url")
-
-        # Get artist information
-        artists = song_details.get("artists", {})
-        primary_artists = artists.get("primary", [])
-        all_artists = artists.get("all", [])
-
-        artist_names = ", ".join(a.get("name", "") for a in primary_artists) or "Unknown"
-        composers = ", ".join(
-            a.get("name", "") for a in all_artists if a.get("role") == "lyricist"
-        )
-        album_artists = ", ".join(
-            a.get("name", "") for a in all_artists
-            if a.get("role") in ["music", "composer"]
-        )
-
-        # Get album information
-        album = song_details.get("album", {})
-        album_name = album.get("name") if isinstance(album, dict) else album
-
-        return {
-            "title": song_details.get("name"),
-            "artist": artist_names,
-            "album": album_name,
-            "year": song_details.get("year"),
-            "image_url": image_url,
-            "album_artist": album_artists or artist_names,
-            "language": song_details.get("language"),
-            "composers": composers or None,
-            "label": song_details.get("label"),
-            "copyright": song_details.get("copyright"),
-            "url": song_details.get("url"),
-            "duration": song_details.get("duration")
-        }
-
 
 def parse_arguments() -> argparse.Namespace:
     """Parse command-line arguments."""
@@ -709,6 +1530,12 @@ Examples:
         help=f"Number of parallel download workers (default: {DEFAULT_WORKERS})"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the response cache or the record of finished tracks"
+    )
+
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -726,8 +1553,12 @@ def main() -> None:
         logger.setLevel(logging.DEBUG)
 
     try:
-        downloader = MusicDownloader(output_dir=args.output)
-        downloader.process_url(args.url, max_workers=args.workers)
+        with MusicDownloader(
+            output_dir=args.output,
+            max_workers=args.workers,
+            use_cache=not args.no_cache
+        ) as downloader:
+            downloader.process_url(args.url)
     except KeyboardInterrupt:
         logger.info("\nOperation cancelled by user")
         sys.exit(1)